@@ -1,9 +1,73 @@
+import ctypes
+import ctypes.util
+import errno
+import os
+import queue
+import select
 import socket
+import struct
+import sys
+import threading
+import traceback
+
+try:
+    import numpy as np
+except ImportError:  # NumPy optionnel: décodage struct objet par objet
+    np = None
 
 # ⚠️ MODIFIER CETTE LIGNE AVEC L'IP DU SERVEUR
 SERVER_IP = "localhost"
 UDP_PORT = 5012
 
+# Affichage détaillé de chaque paquet (False pour les flux à haut débit)
+DEBUG = True
+
+# Buffer de réception noyau, absorbe les rafales pendant le parsing
+RECV_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Nombre max de datagrammes lus par appel recvmmsg (Linux)
+RECV_BATCH_SIZE = 32
+
+# Séparateurs de l'affichage console
+BAR_EQ = "=" * 60
+BAR_DASH = "─" * 60
+
+# Premier byte de chaque trame
+FRAME_HEADER = 0xFB
+
+# Objet: CLS(1) + ID(1) + X1(2) + X2(2) + Y1(2) + Y2(2) + Z(4), big-endian
+OBJECT_STRUCT = struct.Struct(">BBHHHHI")
+
+# Trame maximale: Header(1) + Nb objets(1) + 255 objets + Checksum(1)
+MAX_PACKET_SIZE = 3 + 255 * OBJECT_STRUCT.size
+
+# Paquets en attente de parsing: au plus un buffer noyau de trames maximales.
+# File pleine => la réception bloque et les rafales restent dans SO_RCVBUF;
+# au-delà, le noyau abandonne les datagrammes (compteur dans kernel_drop_count)
+PACKET_QUEUE_SIZE = RECV_BUFFER_SIZE // MAX_PACKET_SIZE
+
+# Intervalle de vérification que le worker de parsing tourne (secondes)
+WORKER_CHECK_INTERVAL = 0.5
+
+# Au-delà de ce nombre d'objets, décodage vectorisé NumPy (si disponible)
+NUMPY_MIN_OBJECTS = 16
+
+# Au-delà de cette taille, somme du checksum calculée par NumPy
+NUMPY_MIN_CHECKSUM_BYTES = 256
+
+if np is not None:
+    OBJECT_DTYPE = np.dtype(
+        [
+            ("cls", "u1"),
+            ("id_track", "u1"),
+            ("x1", ">u2"),
+            ("x2", ">u2"),
+            ("y1", ">u2"),
+            ("y2", ">u2"),
+            ("z", ">u4"),
+        ]
+    )
+
 
 def calculate_checksum(data):
     """
@@ -11,126 +75,466 @@ def calculate_checksum(data):
     Checksum = (Byte2 + Byte3 + Byte4 + ... + ByteN) & 0xFF
 
     Args:
-        data: bytes des données (sans le checksum final)
+        data: bytes (ou memoryview) des données (sans le checksum final)
 
     Returns:
         int: Checksum (1 byte)
     """
     # Somme de tous les bytes sauf le premier (header 0xFB)
-    checksum = sum(data[1:]) & 0xFF
+    if np is not None and len(data) >= NUMPY_MIN_CHECKSUM_BYTES:
+        checksum = int(np.frombuffer(data, dtype=np.uint8, offset=1).sum()) & 0xFF
+    else:
+        checksum = sum(memoryview(data)[1:]) & 0xFF
     return checksum
 
 
+# Parseurs déroulés par nombre d'objets, générés au premier paquet de chaque taille
+_object_parsers = {}
+
+
+def _build_object_parser(count):
+    """
+    Génère un parseur sans boucle pour une trame de count objets
+
+    Args:
+        count: nombre d'objets à décoder
+
+    Returns:
+        Fonction data -> liste de tuples (cls, id_track, x1, x2, y1, y2, z)
+    """
+    calls = ", ".join(
+        f"unpack_from(data, {2 + i * OBJECT_STRUCT.size})" for i in range(count)
+    )
+    source = f"def _parse_objects(data):\n    return [{calls}]\n"
+    namespace = {"unpack_from": OBJECT_STRUCT.unpack_from}
+    exec(compile(source, f"<object parser {count}>", "exec"), namespace)
+    return namespace["_parse_objects"]
+
+
+def decode_objects(data, nb_objects):
+    """
+    Décode les objets de la trame (à partir de l'offset 2, checksum exclu)
+
+    Args:
+        data: bytes (ou memoryview) de la trame complète
+        nb_objects: nombre d'objets annoncé dans la trame
+
+    Returns:
+        list: tuples d'int (cls, id_track, x1, x2, y1, y2, z), indépendants de data
+    """
+    # -1 pour exclure le Checksum (1 byte)
+    count = min(nb_objects, (len(data) - 3) // OBJECT_STRUCT.size)
+
+    # Décodage vectorisé, converti en tuples d'int (même type que la voie struct)
+    if np is not None and count >= NUMPY_MIN_OBJECTS:
+        return np.frombuffer(data, dtype=OBJECT_DTYPE, count=count, offset=2).tolist()
+
+    parser = _object_parsers.get(count)
+    if parser is None:
+        parser = _object_parsers[count] = _build_object_parser(count)
+    return parser(data)
+
+
+def write_lines(lines):
+    """
+    Écrit un bloc de lignes sur stdout en un seul appel (un seul flush)
+
+    Args:
+        lines: liste de str, sans retour à la ligne final
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def parse_data(data, addr):
-    if len(data) < 3:  # Header + Nb objets + Checksum (1 byte)
+    """
+    Valide une trame (header, checksum) et décode ses objets
+
+    Args:
+        data: bytes (ou memoryview) de la trame complète
+        addr: tuple (ip, port) de l'expéditeur
+
+    Returns:
+        list: tuples (cls, id_track, x1, x2, y1, y2, z) (voir decode_objects),
+        ou None si la trame est rejetée (trop courte, header ou checksum invalide)
+    """
+    # Header + Nb objets + Checksum (1 byte), rejet immédiat si header inconnu
+    if len(data) < 3 or data[0] != FRAME_HEADER:
         return
 
-    print(f"\n{'='*60}")
-    print(f"📡 PAQUET REÇU DE {addr[0]}:{addr[1]}")
-    print(f"{'='*60}")
+    # Vue octet par octet partagée par le checksum et le décodage (sans copie)
+    frame = memoryview(data).cast("B")
 
     # Vérifier Checksum (1 byte)
-    received_checksum = data[-1]
-    calculated_checksum = calculate_checksum(data[:-1])
+    received_checksum = frame[-1]
+    calculated_checksum = calculate_checksum(frame[:-1])
 
     # Parser
-    header = data[0]
-    nb_objects = data[1]
-
-    print(f"Header: 0x{header:02X}")
-    print(f"Nombre d'objets: {nb_objects}")
-    print(f"Taille totale: {len(data)} bytes")
-    print(f"Données brutes: {' '.join(f'{b:02X}' for b in data)}")
-
-    print(f"\n{'─'*60}")
-    print(f"🔐 VALIDATION CHECKSUM")
-    print(f"{'─'*60}")
-    print(f"Checksum reçu:     0x{received_checksum:02X}")
-    print(f"Checksum calculé:  0x{calculated_checksum:02X}")
-
-    if received_checksum == calculated_checksum:
-        print(f"✅ CHECKSUM VALIDE - Trame intègre")
-    else:
-        print(f"❌ CHECKSUM INVALIDE - Trame corrompue!")
-        print(f"⚠️  Parsing annulé")
-        print("=" * 60 + "\n")
+    header = frame[0]
+    nb_objects = frame[1]
+
+    if DEBUG:
+        # Tout le paquet est affiché en une seule écriture sur stdout
+        lines = [
+            f"\n{BAR_EQ}",
+            f"📡 PAQUET REÇU DE {addr[0]}:{addr[1]}",
+            BAR_EQ,
+            f"Header: 0x{header:02X}",
+            f"Nombre d'objets: {nb_objects}",
+            f"Taille totale: {len(frame)} bytes",
+            f"Données brutes: {frame.hex(' ').upper()}",
+            f"\n{BAR_DASH}",
+            f"🔐 VALIDATION CHECKSUM",
+            BAR_DASH,
+            f"Checksum reçu:     0x{received_checksum:02X}",
+            f"Checksum calculé:  0x{calculated_checksum:02X}",
+        ]
+
+    if received_checksum != calculated_checksum:
+        if DEBUG:
+            lines += [
+                f"❌ CHECKSUM INVALIDE - Trame corrompue!",
+                f"⚠️  Parsing annulé",
+                BAR_EQ + "\n",
+            ]
+            write_lines(lines)
         return
 
-    print(f"\n{'─'*60}")
-    print(f"📦 OBJETS DÉTECTÉS")
-    print(f"{'─'*60}")
-
-    offset = 2
-    for i in range(nb_objects):
-        # Format: CLS(1) + ID(1) + X1(2) + X2(2) + Y1(2) + Y2(2) + Z(4) = 14 bytes
-        # -1 pour exclure le Checksum (1 byte)
-        if offset + 14 > len(data) - 1:
-            break
-
-        cls = data[offset]
-        id_track = data[offset + 1]
-
-        # Lire X1, X2, Y1, Y2 en big-endian (2 bytes chacun)
-        x1 = (data[offset + 2] << 8) | data[offset + 3]
-        x2 = (data[offset + 4] << 8) | data[offset + 5]
-        y1 = (data[offset + 6] << 8) | data[offset + 7]
-        y2 = (data[offset + 8] << 8) | data[offset + 9]
-
-        # Lire Z en big-endian (4 bytes)
-        z = (
-            (data[offset + 10] << 24)
-            | (data[offset + 11] << 16)
-            | (data[offset + 12] << 8)
-            | data[offset + 13]
-        )
+    objects = decode_objects(frame, nb_objects)
+
+    if not DEBUG:
+        return objects
 
+    lines += [
+        f"✅ CHECKSUM VALIDE - Trame intègre",
+        f"\n{BAR_DASH}",
+        f"📦 OBJETS DÉTECTÉS",
+        BAR_DASH,
+    ]
+
+    for i, (cls, id_track, x1, x2, y1, y2, z) in enumerate(objects):
         # Reconstruire X et Y à partir de X1, X2, Y1, Y2
         x = (x1 << 16) | x2  # X = X1 (high 16 bits) + X2 (low 16 bits)
         y = (y1 << 16) | y2  # Y = Y1 (high 16 bits) + Y2 (low 16 bits)
 
-        print(f"\n📍 Objet {i+1}:")
-        print(f"   CLS:      0x{cls:02X} ({cls})")
-        print(f"   ID_TRACK: 0x{id_track:02X} ({id_track})")
-        print(f"   X1:       0x{x1:04X} ({x1})")
-        print(f"   X2:       0x{x2:04X} ({x2})")
-        print(f"   X:        0x{x:08X} ({x})  [X1<<16 | X2]")
-        print(f"   Y1:       0x{y1:04X} ({y1})")
-        print(f"   Y2:       0x{y2:04X} ({y2})")
-        print(f"   Y:        0x{y:08X} ({y})  [Y1<<16 | Y2]")
-        print(f"   Z:        0x{z:08X} ({z})")
-
-        offset += 14
-
-    print("\n" + "=" * 60 + "\n")
-
-
-# Créer socket
-sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-sock.bind(("0.0.0.0", 0))
-
-print("=" * 60)
-print("🎧 CLIENT UDP DÉMARRÉ")
-print("=" * 60)
-print(f"🖥️  Serveur cible: {SERVER_IP}:{UDP_PORT}")
-print(f"🔐 Validation Checksum simple activée (somme sans header)")
-print(f"📊 Format: X1(2B) + X2(2B) + Y1(2B) + Y2(2B) + Z(4B)")
-print("=" * 60)
-
-# S'enregistrer auprès du serveur
-server_address = (SERVER_IP, UDP_PORT)
-sock.sendto(b"HELLO", server_address)
-print(f"\n✅ Enregistré auprès du serveur")
-print("⏳ En attente de données...\n")
-print("[Ctrl+C pour arrêter]\n")
+        lines += [
+            f"\n📍 Objet {i+1}:",
+            f"   CLS:      0x{cls:02X} ({cls})",
+            f"   ID_TRACK: 0x{id_track:02X} ({id_track})",
+            f"   X1:       0x{x1:04X} ({x1})",
+            f"   X2:       0x{x2:04X} ({x2})",
+            f"   X:        0x{x:08X} ({x})  [X1<<16 | X2]",
+            f"   Y1:       0x{y1:04X} ({y1})",
+            f"   Y2:       0x{y2:04X} ({y2})",
+            f"   Y:        0x{y:08X} ({y})  [Y1<<16 | Y2]",
+            f"   Z:        0x{z:08X} ({z})",
+        ]
 
-try:
+    lines.append("\n" + BAR_EQ + "\n")
+    write_lines(lines)
+    return objects
+
+
+# recvmmsg(2) via ctypes: plusieurs datagrammes par appel système (Linux)
+MSG_WAITFORONE = 0x10000
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _SockaddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_ubyte * 8),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_recvmmsg():
+    """
+    Charge recvmmsg depuis la libc
+
+    Returns:
+        Fonction ctypes recvmmsg, ou None (hors Linux / libc sans recvmmsg)
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        recvmmsg = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+
+    recvmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_MMsgHdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+
+class PacketReceiver:
+    """
+    Réception des datagrammes dans un pool de buffers préalloués
+
+    Utilise recvmmsg (jusqu'à batch_size datagrammes par appel système)
+    sous Linux, et recvfrom_into (un datagramme par appel) ailleurs.
+    """
+
+    def __init__(self, sock, batch_size=RECV_BATCH_SIZE, packet_size=MAX_PACKET_SIZE):
+        self.sock = sock
+        self._recvmmsg = _load_recvmmsg()
+
+        if self._recvmmsg is None:
+            batch_size = 1
+
+        self.batch_size = batch_size
+        self.buffers = [bytearray(packet_size) for _ in range(batch_size)]
+        self.views = [memoryview(buf) for buf in self.buffers]
+
+        if self._recvmmsg is not None:
+            self._setup_headers(packet_size)
+
+    def _setup_headers(self, packet_size):
+        self._iovecs = (_IOVec * self.batch_size)()
+        self._addrs = (_SockaddrIn * self.batch_size)()
+        self._msgs = (_MMsgHdr * self.batch_size)()
+        # Garder les exports ctypes des bytearray (adresse stable)
+        self._c_buffers = [
+            (ctypes.c_char * packet_size).from_buffer(buf) for buf in self.buffers
+        ]
+
+        for i in range(self.batch_size):
+            self._iovecs[i].iov_base = ctypes.addressof(self._c_buffers[i])
+            self._iovecs[i].iov_len = packet_size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def _recv_batch(self, flags):
+        """
+        Un appel recvmmsg sur le pool de buffers
+
+        Returns:
+            int: nombre de datagrammes lus (0 si aucun en attente avec MSG_DONTWAIT)
+        """
+        while True:
+            count = self._recvmmsg(
+                self.sock.fileno(), self._msgs, self.batch_size, flags, None
+            )
+            if count >= 0:
+                return count
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return 0
+            if err != errno.EINTR:
+                raise OSError(err, os.strerror(err))
+
+    def receive(self, timeout=None):
+        """
+        Attend au moins un datagramme puis lit ceux déjà en attente
+
+        Args:
+            timeout: attente max en secondes (None: sans limite)
+
+        Returns:
+            list: tuples (memoryview, (ip, port)), valides jusqu'au prochain appel,
+            vide si aucun datagramme n'est arrivé avant timeout
+        """
+        if self._recvmmsg is None:
+            if timeout is not None and not select.select([self.sock], [], [], timeout)[0]:
+                return []
+            nbytes, addr = self.sock.recvfrom_into(self.buffers[0])
+            return [(self.views[0][:nbytes], addr)]
+
+        for i in range(self.batch_size):
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._addrs[i])
+            hdr.msg_namelen = ctypes.sizeof(_SockaddrIn)
+
+        # Lot déjà en attente: pas d'appel select supplémentaire
+        count = self._recv_batch(socket.MSG_DONTWAIT)
+        if not count:
+            if timeout is not None and not select.select([self.sock], [], [], timeout)[0]:
+                return []
+            count = self._recv_batch(MSG_WAITFORONE)
+
+        packets = []
+        for i in range(count):
+            addr = self._addrs[i]
+            packets.append(
+                (
+                    self.views[i][: self._msgs[i].msg_len],
+                    (socket.inet_ntoa(bytes(addr.sin_addr)), socket.ntohs(addr.sin_port)),
+                )
+            )
+        return packets
+
+
+def kernel_drop_count(sock):
+    """
+    Datagrammes abandonnés par le noyau pour ce socket (buffer de réception plein)
+
+    Args:
+        sock: socket UDP IPv4 encore ouvert
+
+    Returns:
+        int: compteur "drops" de /proc/net/udp, ou None si indisponible (hors Linux)
+    """
+    inode = str(os.fstat(sock.fileno()).st_ino)
+    try:
+        with open("/proc/net/udp") as f:
+            next(f)  # En-tête
+            for line in f:
+                fields = line.split()
+                if fields[9] == inode:
+                    return int(fields[-1])
+    except OSError:
+        pass
+    return None
+
+
+def enqueue_packet(packet_queue, item, worker):
+    """
+    Ajoute un paquet à la file, en attendant tant qu'elle est pleine
+
+    Pendant l'attente, les datagrammes suivants restent dans le buffer
+    noyau (SO_RCVBUF) au lieu d'être abandonnés.
+
+    Args:
+        packet_queue: queue.Queue bornée consommée par le worker
+        item: tuple (bytes, addr), ou None pour arrêter le worker
+        worker: thread consommateur de la file
+
+    Returns:
+        bool: False si le worker est arrêté (paquet non ajouté)
+    """
+    while worker.is_alive():
+        try:
+            packet_queue.put(item, timeout=WORKER_CHECK_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def parse_worker(packet_queue):
+    """
+    Worker: parse les paquets de la file jusqu'à recevoir None
+
+    Args:
+        packet_queue: queue.Queue de tuples (bytes, addr)
+    """
     while True:
-        data, addr = sock.recvfrom(1024)
-        parse_data(data, addr)
+        item = packet_queue.get()
+        if item is None:
+            return
+        try:
+            parse_data(*item)
+        except BrokenPipeError:
+            # stdout fermé: plus rien ne peut être affiché
+            return
+        except Exception:
+            # Un paquet en erreur ne doit pas arrêter le worker
+            print(f"❌ Erreur de parsing d'un paquet de {item[1]}:", file=sys.stderr)
+            traceback.print_exc()
+
+
+def main():
+    # Créer socket
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+    sock.bind(("0.0.0.0", 0))
+
+    # Buffers de réception réutilisés pour chaque lot (pas d'allocation)
+    receiver = PacketReceiver(sock)
+
+    print(BAR_EQ)
+    print("🎧 CLIENT UDP DÉMARRÉ")
+    print(BAR_EQ)
+    print(f"🖥️  Serveur cible: {SERVER_IP}:{UDP_PORT}")
+    print(f"🔐 Validation Checksum simple activée (somme sans header)")
+    print(f"📊 Format: X1(2B) + X2(2B) + Y1(2B) + Y2(2B) + Z(4B)")
+    # Valeur effective (Linux la double, et la plafonne à net.core.rmem_max)
+    rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    print(f"📥 Buffer réception: {rcvbuf} bytes")
+    expected_rcvbuf = RECV_BUFFER_SIZE * (2 if sys.platform.startswith("linux") else 1)
+    if rcvbuf < expected_rcvbuf:
+        print(f"⚠️  Buffer plafonné par le système (demandé: {RECV_BUFFER_SIZE} bytes),")
+        print(f"   risque de pertes en rafale (Linux: sysctl net.core.rmem_max)")
+    print(f"📦 Réception par lots: {receiver.batch_size} paquet(s) par appel système")
+    print(f"🔎 Affichage détaillé: {'activé' if DEBUG else 'désactivé'}")
+    print(BAR_EQ)
 
-except KeyboardInterrupt:
-    print("\n\n⛔ Arrêt du client...")
+    # S'enregistrer auprès du serveur
+    server_address = (SERVER_IP, UDP_PORT)
+    sock.sendto(b"HELLO", server_address)
+    print(f"\n✅ Enregistré auprès du serveur")
+    print("⏳ En attente de données...\n")
+    print("[Ctrl+C pour arrêter]\n")
+
+    # Parsing/affichage hors du thread de réception
+    packet_queue = queue.Queue(maxsize=PACKET_QUEUE_SIZE)
+    worker = threading.Thread(target=parse_worker, args=(packet_queue,), daemon=True)
+    worker.start()
+
+    try:
+        while worker.is_alive():
+            # Attente bornée: un worker arrêté est détecté même sans trafic
+            for packet, addr in receiver.receive(timeout=WORKER_CHECK_INTERVAL):
+                # Copie: les buffers du receiver sont réutilisés au prochain lot
+                if not enqueue_packet(packet_queue, (bytes(packet), addr), worker):
+                    break
+
+        print("\n❌ Worker de parsing arrêté", file=sys.stderr)
+
+    except KeyboardInterrupt:
+        pass
+
+    # Se désinscrire avant tout affichage (stdout peut être fermé)
     sock.sendto(b"DISCONNECT", server_address)
+    kernel_drops = kernel_drop_count(sock)
     sock.close()
-    print("✓ Socket fermé")
-    print("👋 Au revoir!")
+
+    try:
+        print("\n\n⛔ Arrêt du client...")
+        if worker.is_alive():
+            # Laisser le worker vider la file (sentinelle None), dans la limite du délai
+            try:
+                packet_queue.put(None, timeout=2)
+            except queue.Full:
+                pass
+            worker.join(timeout=2)
+            if worker.is_alive():
+                print(f"⚠️  Arrêt avant la fin du parsing: {packet_queue.qsize()} paquet(s) non traité(s)")
+        if kernel_drops:
+            print(f"⚠️  {kernel_drops} paquet(s) perdu(s) par le noyau (buffer réception plein)")
+        print("✓ Socket fermé")
+        print("👋 Au revoir!")
+    except BrokenPipeError:
+        # stdout fermé (ex: | head): éviter une seconde erreur au flush de sortie
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+if __name__ == "__main__":
+    main()